@@ -1,15 +1,96 @@
-import boto3
-from botocore.exceptions import NoCredentialsError, PartialCredentialsError
 import sys
 import subprocess
 import os
 import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+# boto3/botocore (and aioboto3) are imported lazily: loading them dominates
+# start-up time and is wasted when the menu is closed without an AWS call.
+MAX_POOL_CONNECTIONS = 50
+_boto_config = None
+_session = None
+
+def get_boto_config():
+    """
+    Shared client configuration: a larger connection pool, TCP keepalive and
+    adaptive retries so concurrent calls reuse connections instead of re-handshaking.
+    """
+    global _boto_config
+    if _boto_config is None:
+        from botocore.config import Config
+        _boto_config = Config(
+            region_name='us-east-1',
+            max_pool_connections=MAX_POOL_CONNECTIONS,
+            tcp_keepalive=True,
+            retries={'mode': 'adaptive', 'max_attempts': 10},
+        )
+    return _boto_config
+
+def get_session():
+    """
+    One session for every client, so credentials and endpoint data are resolved once.
+    """
+    global _session
+    if _session is None:
+        import boto3
+        _session = boto3.Session(region_name='us-east-1')
+    return _session
+
+def _load_aioboto3():
+    try:
+        import aioboto3
+    except ImportError:
+        return None
+    return aioboto3
+
+# Upper bound on concurrent SSM invocations (tasks or threads) in condor_status,
+# kept below the pool size
+MAX_CONCURRENCY = 32
+
+# SSM send_command accepts at most 50 instance IDs per call
+SSM_BATCH_SIZE = 50
+
+# Only instances registered with SSM and currently reachable can run commands;
+# sending to any other instance fails the whole send_command batch
+SSM_ONLINE_FILTER = [{"Key": "PingStatus", "Values": ["Online"]}]
+
+# Polling of SSM command invocations until they reach a final status
+COMMAND_TERMINAL_STATUSES = {'Success', 'Failed', 'Cancelled', 'TimedOut'}
+COMMAND_POLL_ATTEMPTS = 30
+
+# list_command_invocations truncates each plugin's Output to this many characters;
+# longer output is fetched in full with get_command_invocation
+SSM_PLUGIN_OUTPUT_LIMIT = 2500
+
+# A plugin's Output is stdout, then this marker line, then stderr
+SSM_STDERR_MARKER = "----------ERROR-------"
+
+# Zone/region listings rarely change, so cache them per region for a day
+METADATA_CACHE_TTL = 24 * 60 * 60
+_metadata_cache = {}
+
+# AMI IDs already confirmed to exist, keyed by (region, AMI ID)
+_valid_amis = set()
+
+# Fields shown by list_instances, extracted from each describe_instances page
+INSTANCE_ROWS = "Reservations[].Instances[].[InstanceId, ImageId, InstanceType, State.Name, Monitoring.State]"
+_instance_rows = None
+
+def _instance_rows_expr():
+    # jmespath ships with botocore; import it lazily alongside the other boto imports
+    global _instance_rows
+    if _instance_rows is None:
+        import jmespath
+        _instance_rows = jmespath.compile(INSTANCE_ROWS)
+    return _instance_rows
 
 
 # Initialize AWS EC2 Client
 def init():
+    from botocore.exceptions import NoCredentialsError, PartialCredentialsError
     try:
-        ec2 = boto3.client('ec2', region_name='us-east-1')
+        ec2 = get_session().client('ec2', config=get_boto_config())
         return ec2
     except (NoCredentialsError, PartialCredentialsError) as e:
         print("Cannot load the credentials. Make sure your AWS CLI is configured.")
@@ -18,52 +99,91 @@ def init():
 # List all instances
 def list_instances(ec2):
     print("Listing instances....")
-    response = ec2.describe_instances()
-    for reservation in response['Reservations']:
-        for instance in reservation['Instances']:
-            print(
-                f"[id] {instance['InstanceId']}, "
-                f"[AMI] {instance['ImageId']}, "
-                f"[type] {instance['InstanceType']}, "
-                f"[state] {instance['State']['Name']}, "
-                f"[monitoring state] {instance['Monitoring']['State']}"
-            )
+    rows_expr = _instance_rows_expr()
+    paginator = ec2.get_paginator('describe_instances')
+    for page in paginator.paginate(PaginationConfig={'PageSize': 1000}):
+        rows = rows_expr.search(page)
+        if not rows:
+            continue
+        sys.stdout.write("".join(
+            f"[id] {instance_id}, "
+            f"[AMI] {image_id}, "
+            f"[type] {instance_type}, "
+            f"[state] {state}, "
+            f"[monitoring state] {monitoring}\n"
+            for instance_id, image_id, instance_type, state, monitoring in rows
+        ))
+
+# Cached describe_* calls for region/AZ metadata
+def _cached_describe(ec2, operation):
+    key = (operation, ec2.meta.region_name)
+    now = time.monotonic()
+    entry = _metadata_cache.get(key)
+    if entry and now - entry[0] < METADATA_CACHE_TTL:
+        return entry[1]
+
+    response = getattr(ec2, operation)()
+    _metadata_cache[key] = (now, response)
+    return response
+
+def clear_metadata_cache():
+    _metadata_cache.clear()
+    print("Metadata cache cleared.")
 
 # List available zones
 def available_zones(ec2):
     print("Available zones....")
     try:
-        response = ec2.describe_availability_zones()
-        for zone in response['AvailabilityZones']:
-            print(f"[id] {zone['ZoneId']}, [region] {zone['RegionName']}, [zone] {zone['ZoneName']}")
-        print(f"You have access to {len(response['AvailabilityZones'])} Availability Zones.")
+        response = _cached_describe(ec2, 'describe_availability_zones')
+        buf = [
+            f"[id] {zone['ZoneId']}, [region] {zone['RegionName']}, [zone] {zone['ZoneName']}\n"
+            for zone in response['AvailabilityZones']
+        ]
+        buf.append(f"You have access to {len(response['AvailabilityZones'])} Availability Zones.\n")
+        sys.stdout.write("".join(buf))
     except Exception as e:
         print(f"Error: {e}")
 
-# Start an instance
-def start_instance(ec2, instance_id):
+# Split a comma-separated list of instance IDs
+def _parse_instance_ids(value):
+    return [x.strip() for x in value.split(',') if x.strip()]
+
+# Start one or more instances
+def start_instance(ec2, instance_ids):
+    ids = _parse_instance_ids(instance_ids)
+    if not ids:
+        print("No instance IDs given.")
+        return
     try:
-        print(f"Starting instance {instance_id}...")
-        ec2.start_instances(InstanceIds=[instance_id])
-        print(f"Successfully started instance {instance_id}.")
+        print(f"Starting instance(s) {', '.join(ids)}...")
+        ec2.start_instances(InstanceIds=ids)
+        print(f"Successfully started instance(s) {', '.join(ids)}.")
     except Exception as e:
         print(f"Error: {e}")
 
-# Stop an instance
-def stop_instance(ec2, instance_id):
+# Stop one or more instances
+def stop_instance(ec2, instance_ids):
+    ids = _parse_instance_ids(instance_ids)
+    if not ids:
+        print("No instance IDs given.")
+        return
     try:
-        print(f"Stopping instance {instance_id}...")
-        ec2.stop_instances(InstanceIds=[instance_id])
-        print(f"Successfully stopped instance {instance_id}.")
+        print(f"Stopping instance(s) {', '.join(ids)}...")
+        ec2.stop_instances(InstanceIds=ids)
+        print(f"Successfully stopped instance(s) {', '.join(ids)}.")
     except Exception as e:
         print(f"Error: {e}")
 
-# Reboot an instance
-def reboot_instance(ec2, instance_id):
+# Reboot one or more instances
+def reboot_instance(ec2, instance_ids):
+    ids = _parse_instance_ids(instance_ids)
+    if not ids:
+        print("No instance IDs given.")
+        return
     try:
-        print(f"Rebooting instance {instance_id}...")
-        ec2.reboot_instances(InstanceIds=[instance_id])
-        print(f"Successfully rebooted instance {instance_id}.")
+        print(f"Rebooting instance(s) {', '.join(ids)}...")
+        ec2.reboot_instances(InstanceIds=ids)
+        print(f"Successfully rebooted instance(s) {', '.join(ids)}.")
     except Exception as e:
         print(f"Error: {e}")
 
@@ -71,15 +191,41 @@ def reboot_instance(ec2, instance_id):
 def available_regions(ec2):
     print("Available regions....")
     try:
-        response = ec2.describe_regions()
-        for region in response['Regions']:
-            print(f"[region] {region['RegionName']}, [endpoint] {region['Endpoint']}")
+        response = _cached_describe(ec2, 'describe_regions')
+        sys.stdout.write("".join(
+            f"[region] {region['RegionName']}, [endpoint] {region['Endpoint']}\n"
+            for region in response['Regions']
+        ))
     except Exception as e:
         print(f"Error: {e}")
 
+# Check that an AMI exists before launching. Only AMIs found to exist are cached;
+# misses are always re-checked, since an AMI may be shared or registered later.
+def _ami_exists(ec2, ami_id):
+    from botocore.exceptions import ClientError
+    key = (ec2.meta.region_name, ami_id)
+    if key in _valid_amis:
+        return True
+
+    try:
+        response = ec2.describe_images(ImageIds=[ami_id])
+    except ClientError as e:
+        if e.response['Error']['Code'].startswith('InvalidAMIID'):
+            return False
+        raise
+
+    if response['Images']:
+        _valid_amis.add(key)
+        return True
+    return False
+
 # Create an instance
 def create_instance(ec2, ami_id):
     try:
+        if not _ami_exists(ec2, ami_id):
+            print(f"Error: AMI {ami_id} does not exist or is not accessible.")
+            return
+
         print(f"Creating an instance with AMI {ami_id}...")
         response = ec2.run_instances(
             ImageId=ami_id,
@@ -96,11 +242,17 @@ def create_instance(ec2, ami_id):
 def list_images(ec2):
     print("Listing images....")
     try:
-        response = ec2.describe_images(Owners=['self'])
-        if 'Images' in response and response['Images']:
-            for image in response['Images']:
-                print(f"[ImageID] {image['ImageId']}, [Name] {image.get('Name', 'N/A')}, [Owner] {image['OwnerId']}")
-        else:
+        paginator = ec2.get_paginator('describe_images')
+        found = False
+        for page in paginator.paginate(Owners=['self'], PaginationConfig={'PageSize': 1000}):
+            buf = [
+                f"[ImageID] {image['ImageId']}, [Name] {image.get('Name', 'N/A')}, [Owner] {image['OwnerId']}\n"
+                for image in page.get('Images', [])
+            ]
+            if buf:
+                found = True
+                sys.stdout.write("".join(buf))
+        if not found:
             print("No images found.")
     except Exception as e:
         print(f"Error while listing images: {e}")
@@ -115,52 +267,254 @@ def get_running_instances(ec2_client, filters=None):
     """
     filters = filters or [{"Name": "instance-state-name", "Values": ["running"]}]
     
-    response = ec2_client.describe_instances(Filters=filters)
-    instance_ids = []
-    
-    for reservation in response["Reservations"]:
-        for instance in reservation["Instances"]:
-            instance_ids.append(instance["InstanceId"])
-    
-    return instance_ids
+    paginator = ec2_client.get_paginator("describe_instances")
+    pages = paginator.paginate(Filters=filters, PaginationConfig={"PageSize": 1000})
+
+    # Project only the IDs out of each page; the rest of the payload is discarded
+    return list(pages.search("Reservations[].Instances[].InstanceId"))
+
+# condor_status runs the same SSM pipeline either on aioboto3 coroutines or, when
+# aioboto3 is not installed, on blocking boto3 calls in a thread pool. The helpers
+# below hold everything that does not touch the network so both paths share it.
 
-def run_command_on_instance(instance_id, command):
+def _send_command_args(instance_ids, command):
+    return {
+        "InstanceIds": instance_ids,
+        "DocumentName": "AWS-RunShellScript",
+        "Parameters": {"commands": [command]},
+    }
+
+def _list_invocations_args(command_id):
+    return {"CommandId": command_id, "Details": True, "MaxResults": SSM_BATCH_SIZE}
+
+def _split_plugin_output(output):
+    stdout, marker, stderr = output.partition(SSM_STDERR_MARKER)
+    if marker:
+        stdout = stdout.removesuffix("\n")
+    return stdout, stderr.strip()
+
+def _finished_outputs(response, outputs):
     """
-    Execute a command on an EC2 instance using AWS SSM.
-    :param instance_id: The ID of the EC2 instance.
-    :param command: The shell command to execute.
-    :return: The output of the command.
+    Record every newly finished invocation in a list_command_invocations response
+    into outputs (instance ID -> stdout, or an exception if the command did not succeed).
+    :return: Instance IDs whose output hit SSM_PLUGIN_OUTPUT_LIMIT and needs a full fetch.
     """
-    ssm_client = boto3.client('ssm', region_name='us-east-1')
+    truncated = []
+    for invocation in response["CommandInvocations"]:
+        instance_id = invocation["InstanceId"]
+        status = invocation["Status"]
+        if instance_id in outputs or status not in COMMAND_TERMINAL_STATUSES:
+            continue
+
+        plugins = invocation.get("CommandPlugins") or [{}]
+        output = plugins[0].get("Output", "")
+        stdout, stderr = _split_plugin_output(output)
+        if status != "Success":
+            detail = f": {stderr}" if stderr else "."
+            outputs[instance_id] = RuntimeError(f"Command {status.lower()} on instance {instance_id}{detail}")
+            continue
+
+        outputs[instance_id] = stdout
+        if len(output) >= SSM_PLUGIN_OUTPUT_LIMIT:
+            truncated.append(instance_id)
+    return truncated
+
+def _store_full_outputs(outputs, instance_ids, results):
+    """
+    Replace truncated outputs with the get_command_invocation results fetched for them;
+    a failed fetch is recorded against its own instance only.
+    """
+    for instance_id, result in zip(instance_ids, results):
+        outputs[instance_id] = result if isinstance(result, Exception) else result["StandardOutputContent"]
+
+def _ordered_outputs(command_id, instance_ids, outputs):
+    return [
+        outputs.get(instance_id, TimeoutError(f"Command {command_id} did not finish on instance {instance_id}"))
+        for instance_id in instance_ids
+    ]
 
+def _poll_delay(attempt):
+    return min(0.2 * 2 ** attempt, 2)
+
+def _managed_filters(instance_ids):
+    # Query only the candidate instances rather than every managed instance in the account
+    return SSM_ONLINE_FILTER + [{"Key": "InstanceIds", "Values": instance_ids}]
+
+def _online_instances(instance_ids, pages):
+    """
+    Keep the instances listed in describe_instance_information pages, in their original order.
+    """
+    online = {info["InstanceId"] for page in pages for info in page["InstanceInformationList"]}
+    return [instance_id for instance_id in instance_ids if instance_id in online]
+
+def _unmanaged_error(instance_id):
+    return RuntimeError(f"Instance {instance_id} is not managed by SSM or is not online.")
+
+def _batch_failed(instance_ids, error):
+    return [error] * len(instance_ids)
+
+def _chunks(items, size):
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+def _assemble_outputs(instance_ids, batches, results):
+    """
+    Map per-batch results back onto instance_ids, in order.
+    A batch that raised reports its exception for every instance in it; instances
+    that were not in any batch are reported as not managed by SSM.
+    """
+    outputs = {}
+    for batch, result in zip(batches, results):
+        if isinstance(result, Exception):
+            result = _batch_failed(batch, result)
+        outputs.update(zip(batch, result))
+    return [
+        outputs[instance_id] if instance_id in outputs else _unmanaged_error(instance_id)
+        for instance_id in instance_ids
+    ]
+
+# Blocking pipeline, used by _threaded_condor_status
+
+def _send_command_sync(ssm_client, instance_ids, command):
+    """
+    Send a shell command to up to SSM_BATCH_SIZE instances.
+    :return: The SSM command ID.
+    """
+    response = ssm_client.send_command(**_send_command_args(instance_ids, command))
+    return response["Command"]["CommandId"]
+
+def _wait_for_batch_sync(ssm_client, command_id, instance_ids):
+    """
+    Wait for an SSM command to finish on a batch of instances.
+    All invocations of the command are fetched with one list_command_invocations
+    call per poll round rather than one get_command_invocation per instance; only
+    outputs truncated at SSM_PLUGIN_OUTPUT_LIMIT are re-fetched individually.
+    :return: stdout or exception per instance, in order; a TimeoutError for instances that did not finish.
+    """
+    outputs = {}
+    for attempt in range(COMMAND_POLL_ATTEMPTS):
+        response = ssm_client.list_command_invocations(**_list_invocations_args(command_id))
+        truncated = _finished_outputs(response, outputs)
+        results = []
+        for instance_id in truncated:
+            try:
+                results.append(ssm_client.get_command_invocation(CommandId=command_id, InstanceId=instance_id))
+            except Exception as e:
+                results.append(e)
+        _store_full_outputs(outputs, truncated, results)
+        if len(outputs) == len(instance_ids):
+            break
+        time.sleep(_poll_delay(attempt))
+
+    return _ordered_outputs(command_id, instance_ids, outputs)
+
+def _managed_instances_sync(ssm_client, instance_ids):
+    """
+    Keep only the instances that are managed by SSM and online.
+    """
+    paginator = ssm_client.get_paginator("describe_instance_information")
+    pages = [
+        page
+        for chunk in _chunks(instance_ids, SSM_BATCH_SIZE)
+        for page in paginator.paginate(Filters=_managed_filters(chunk))
+    ]
+    return _online_instances(instance_ids, pages)
+
+def _threaded_condor_status(instance_ids, condor_command, max_concurrency=MAX_CONCURRENCY):
+    """
+    Run condor_command on instance_ids with a thread pool, used when aioboto3 is not installed.
+    boto3 releases the GIL while waiting on the network, so the polls still overlap.
+    :return: Output or exception per instance, in order.
+    """
+    ssm_client = get_session().client('ssm', config=get_boto_config())
     try:
-        # Send command to the instance
-        response = ssm_client.send_command(
-            InstanceIds=[instance_id],
-            DocumentName="AWS-RunShellScript",
-            Parameters={"commands": [command]},
-        )
+        managed = _managed_instances_sync(ssm_client, instance_ids)
+    except Exception as e:
+        # e.g. missing ssm:DescribeInstanceInformation permission
+        return _batch_failed(instance_ids, e)
+    batches = _chunks(managed, SSM_BATCH_SIZE)
 
-        command_id = response["Command"]["CommandId"]
-        print(f"Command sent. Command ID: {command_id}")
-        
-        # Wait for the command to complete
-        time.sleep(2)
-        result = ssm_client.get_command_invocation(
-            CommandId=command_id,
-            InstanceId=instance_id,
+    def run_batch(batch):
+        try:
+            print(f"Running '{condor_command}' on {len(batch)} instance(s)...")
+            command_id = _send_command_sync(ssm_client, batch, condor_command)
+            print(f"Command sent. Command ID: {command_id}")
+            return _wait_for_batch_sync(ssm_client, command_id, batch)
+        except Exception as e:
+            return e
+
+    results = []
+    if batches:
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(batches))) as executor:
+            results = list(executor.map(run_batch, batches))
+    return _assemble_outputs(instance_ids, batches, results)
+
+# aioboto3 pipeline, used by _gather_condor_status; each step mirrors its _sync
+# counterpart above
+
+async def _send_command(ssm_client, instance_ids, command):
+    response = await ssm_client.send_command(**_send_command_args(instance_ids, command))
+    return response["Command"]["CommandId"]
+
+async def _wait_for_batch(ssm_client, command_id, instance_ids):
+    outputs = {}
+
+    # Poll with exponential backoff until every invocation reaches a final status
+    for attempt in range(COMMAND_POLL_ATTEMPTS):
+        response = await ssm_client.list_command_invocations(**_list_invocations_args(command_id))
+        truncated = _finished_outputs(response, outputs)
+        results = await asyncio.gather(
+            *(ssm_client.get_command_invocation(CommandId=command_id, InstanceId=instance_id)
+              for instance_id in truncated),
+            return_exceptions=True,
         )
+        _store_full_outputs(outputs, truncated, results)
+        if len(outputs) == len(instance_ids):
+            break
+        await asyncio.sleep(_poll_delay(attempt))
 
-        print(f"Command output from instance {instance_id}:\n")
-        return result["StandardOutputContent"]
+    return _ordered_outputs(command_id, instance_ids, outputs)
 
+async def _managed_instances(ssm_client, instance_ids):
+    paginator = ssm_client.get_paginator("describe_instance_information")
+    pages = []
+    for chunk in _chunks(instance_ids, SSM_BATCH_SIZE):
+        pages += [page async for page in paginator.paginate(Filters=_managed_filters(chunk))]
+    return _online_instances(instance_ids, pages)
 
-    except Exception as e:
-        print(f"An error occurred: {e}")
-        return None
+async def _run_command_on_batch(ssm_client, sem, instance_ids, command):
+    async with sem:
+        print(f"Running '{command}' on {len(instance_ids)} instance(s)...")
+        command_id = await _send_command(ssm_client, instance_ids, command)
+    print(f"Command sent. Command ID: {command_id}")
+
+    async with sem:
+        return await _wait_for_batch(ssm_client, command_id, instance_ids)
+
+async def _gather_condor_status(aioboto3, instance_ids, condor_command, max_concurrency=MAX_CONCURRENCY):
+    """
+    Run condor_command on instance_ids concurrently with aioboto3.
+    :return: Output or exception per instance, in order.
+    """
+    sem = asyncio.Semaphore(max_concurrency)
+
+    async def run(ssm_client):
+        try:
+            managed = await _managed_instances(ssm_client, instance_ids)
+        except Exception as e:
+            # e.g. missing ssm:DescribeInstanceInformation permission
+            return _batch_failed(instance_ids, e)
+        batches = _chunks(managed, SSM_BATCH_SIZE)
+        tasks = [_run_command_on_batch(ssm_client, sem, batch, condor_command) for batch in batches]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        return _assemble_outputs(instance_ids, batches, results)
+
+    # One SSM client for every invocation so its connection pool is reused
+    session = aioboto3.Session()
+    async with session.client('ssm', config=get_boto_config()) as ssm_client:
+        return await run(ssm_client)
 
 def condor_status():
-    ec2_client = boto3.client("ec2", region_name="us-east-1")
+    ec2_client = get_session().client("ec2", config=get_boto_config())
     
     print("Fetching running EC2 instances...")
     instance_ids = get_running_instances(ec2_client)
@@ -172,73 +526,82 @@ def condor_status():
     print(f"Found {len(instance_ids)} running instance(s): {instance_ids}")
     condor_command = "condor_status"
 
-    for instance_id in instance_ids:
-        try:
-            print(f"Running '{condor_command}' on instance {instance_id}...")
-            output = run_command_on_instance(instance_id, condor_command)
-            
-            if output:
-                print(f"\nHTCondor Resource Status for instance {instance_id}:\n")
-                print(output)
-            else:
-                print(f"Failed to retrieve condor_status for instance {instance_id}.")
-        except Exception as e:
-            print(f"An error occurred while processing instance {instance_id}: {e}")
+    aioboto3 = _load_aioboto3()
+    if aioboto3 is None:
+        outputs = _threaded_condor_status(instance_ids, condor_command)
+    else:
+        outputs = asyncio.run(_gather_condor_status(aioboto3, instance_ids, condor_command))
+
+    for instance_id, output in zip(instance_ids, outputs):
+        if isinstance(output, Exception):
+            print(f"An error occurred while processing instance {instance_id}: {output}")
+        elif output:
+            print(f"\nHTCondor Resource Status for instance {instance_id}:\n")
+            print(output)
+        else:
+            print(f"Failed to retrieve condor_status for instance {instance_id}.")
 
 
 
 
 # Main menu
+MENU = (
+    "\n------------------------------------------------------------\n"
+    "             Amazon AWS Control Panel using SDK             \n"
+    "------------------------------------------------------------\n"
+    "  1. List instances              2. Available zones\n"
+    "  3. Start instance              4. Available regions\n"
+    "  5. Stop instance               6. Create instance\n"
+    "  7. Reboot instance             8. List images\n"
+    "  9. condor_status               99. Quit\n"
+    "------------------------------------------------------------"
+)
+
+def prompt_and_call(ec2, fn, label):
+    value = input(f"Enter {label}: ").strip()
+    if value:
+        fn(ec2, value)
+
+# Menu actions; each takes the (lazily created) EC2 client
+ACTIONS = {
+    1: list_instances,
+    2: available_zones,
+    3: lambda ec2: prompt_and_call(ec2, start_instance, "instance ID(s), comma-separated"),
+    4: available_regions,
+    5: lambda ec2: prompt_and_call(ec2, stop_instance, "instance ID(s), comma-separated"),
+    6: lambda ec2: prompt_and_call(ec2, create_instance, "AMI ID"),
+    7: lambda ec2: prompt_and_call(ec2, reboot_instance, "instance ID(s), comma-separated"),
+    8: list_images,
+    9: lambda ec2: condor_status(),
+    98: lambda ec2: clear_metadata_cache(),
+}
+
+# Menu entries that need the EC2 client
+EC2_CHOICES = {1, 2, 3, 4, 5, 6, 7, 8}
+
 def main():
-    ec2 = init()
+    ec2 = None
     while True:
-        print("\n" + "------------------------------------------------------------")
-        print("             Amazon AWS Control Panel using SDK             ")
-        print("------------------------------------------------------------")
-        print("  1. List instances              2. Available zones")
-        print("  3. Start instance              4. Available regions")
-        print("  5. Stop instance               6. Create instance")
-        print("  7. Reboot instance             8. List images")
-        print("  9. condor_status               99. Quit")
-        print("------------------------------------------------------------")
-
-        choice = input("Enter an integer: ")
-        if not choice.isdigit():
+        print(MENU)
+
+        try:
+            choice = int(input("Enter an integer: "))
+        except ValueError:
             print("Invalid input. Please enter a number.")
             continue
 
-        choice = int(choice)
-        if choice == 1:
-            list_instances(ec2)
-        elif choice == 2:
-            available_zones(ec2)
-        elif choice == 3:
-            instance_id = input("Enter instance ID: ").strip()
-            if instance_id:
-                start_instance(ec2, instance_id)
-        elif choice == 4:
-            available_regions(ec2)
-        elif choice == 5:
-            instance_id = input("Enter instance ID: ").strip()
-            if instance_id:
-                stop_instance(ec2, instance_id)
-        elif choice == 6:
-            ami_id = input("Enter AMI ID: ").strip()
-            if ami_id:
-                create_instance(ec2, ami_id)
-        elif choice == 7:
-            instance_id = input("Enter instance ID: ").strip()
-            if instance_id:
-                reboot_instance(ec2, instance_id)
-        elif choice == 8:
-            list_images(ec2)
-        elif choice == 9:
-            condor_status()
-        elif choice == 99:
+        if choice == 99:
             print("Goodbye!")
             break
-        else:
+
+        action = ACTIONS.get(choice)
+        if action is None:
             print("Invalid choice. Please try again.")
+            continue
+
+        if choice in EC2_CHOICES and ec2 is None:
+            ec2 = init()
+        action(ec2)
 
 
 